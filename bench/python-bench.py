@@ -3,18 +3,35 @@
 Benchmark script for jsonriver Python implementation
 
 Compares performance of jsonriver vs json.loads on different file sizes.
+If orjson is installed it is included as an additional buffered baseline.
+
+Each comparison is timed inside worker processes, so the parsers don't share
+interpreter state (allocator, caches, GC pressure) with one another.
 
 Copyright (c) 2024 jsonriver-python contributors
 SPDX-License-Identifier: BSD-3-Clause
 """
 
+import array
 import asyncio
 import json
+import os
 import statistics
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add parent directory to path to import jsonriver
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -55,22 +72,95 @@ def json_loads_parse(json_string: str):
     return json.loads(json_string)
 
 
+def orjson_loads_parse(json_string: str):
+    """Parse JSON using orjson.loads"""
+    return orjson.loads(json_string)
+
+
+def run_event_loop(coro):
+    """Run a coroutine on uvloop if available, unless --no-uvloop is passed"""
+    if uvloop is not None and "--no-uvloop" not in sys.argv:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+# Input for the current file, set once per worker process by the pool
+# initializer so it isn't pickled with every batch.
+_worker_json_str = None
+
+
+def _init_worker(json_str: str):
+    """Store the file being benchmarked in the worker process"""
+    global _worker_json_str
+    _worker_json_str = json_str
+
+
+async def _time_async_runs(parse_fn, json_str: str, num_runs: int):
+    """Time num_runs awaits of an async parse function, in ns"""
+    times = array.array("q")
+    for _ in range(num_runs):
+        start = time.perf_counter_ns()
+        await parse_fn(json_str)
+        times.append(time.perf_counter_ns() - start)
+    return times
+
+
+def time_comparison(comparison, num_runs: int):
+    """Time a batch of runs of one comparison inside a worker process, in ns"""
+    parse_fn = comparison["parse"]
+    json_str = _worker_json_str
+    if comparison["async"]:
+        return run_event_loop(_time_async_runs(parse_fn, json_str, num_runs))
+
+    times = array.array("q")
+    for _ in range(num_runs):
+        start = time.perf_counter_ns()
+        parse_fn(json_str)
+        times.append(time.perf_counter_ns() - start)
+    return times
+
+
+def available_cpus() -> int:
+    """Number of CPUs this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 async def benchmark_file(comparisons, json_str: str, name: str, num_times: int):
     """Benchmark parsing of a file"""
-    times = {comp["name"]: [] for comp in comparisons}
+    times = {comp["name"]: array.array("q") for comp in comparisons}
+
+    # Batch runs per submission so IPC cost is paid ~10 times per comparison
+    # rather than once per run, and is never inside the timed region.
+    batch_size = max(1, num_times // 10)
+    batches = [
+        min(batch_size, num_times - i) for i in range(0, num_times, batch_size)
+    ]
+    loop = asyncio.get_running_loop()
+
+    async def run_comparison(comparison):
+        # One dedicated worker process per comparison
+        with ProcessPoolExecutor(
+            max_workers=1,
+            initializer=_init_worker,
+            initargs=(json_str,),
+        ) as pool:
+            for batch in batches:
+                batch_times = await loop.run_in_executor(
+                    pool, time_comparison, comparison, batch
+                )
+                times[comparison["name"]].extend(batch_times)
+                print(".", end="", flush=True)
 
     print(f"Running {name}...", end="", flush=True)
-    for i in range(num_times):
-        if i % max(1, num_times // 10) == 0:  # Show progress every 10%
-            print(".", end="", flush=True)
+    # Comparisons only run side by side when each can have its own core;
+    # otherwise they would time-share a CPU and inflate each other's timings.
+    if available_cpus() >= len(comparisons):
+        await asyncio.gather(*(run_comparison(c) for c in comparisons))
+    else:
         for comparison in comparisons:
-            start = time.perf_counter()
-            if comparison["async"]:
-                await comparison["parse"](json_str)
-            else:
-                comparison["parse"](json_str)
-            elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
-            times[comparison["name"]].append(elapsed)
+            await run_comparison(comparison)
     print(" done!")
 
     # Report mean and standard deviation
@@ -78,8 +168,9 @@ async def benchmark_file(comparisons, json_str: str, name: str, num_times: int):
     for comparison in comparisons:
         name_str = comparison["name"]
         time_list = times[name_str]
-        mean_time = statistics.mean(time_list)
-        std_dev = statistics.stdev(time_list) if len(time_list) > 1 else 0.0
+        # Timings are collected in ns; convert to ms only for reporting
+        mean_time = statistics.fmean(time_list) / 1e6
+        std_dev = statistics.stdev(time_list) / 1e6 if len(time_list) > 1 else 0.0
 
         print(f"  {name_str.ljust(25)} {mean_time:>10.3f}ms ±{std_dev:.2f}ms")
     print("\n")
@@ -87,6 +178,8 @@ async def benchmark_file(comparisons, json_str: str, name: str, num_times: int):
 
 async def main():
     """Run all benchmarks"""
+    loop_type = type(asyncio.get_running_loop())
+    print(f"Event loop: {loop_type.__module__}.{loop_type.__qualname__}")
     print("Loading test data...")
     small_json, medium_json, large_json = load_test_data()
 
@@ -102,6 +195,14 @@ async def main():
             "async": False,
         },
     ]
+    if orjson is not None:
+        comparisons.append(
+            {
+                "name": "orjson.loads",
+                "parse": orjson_loads_parse,
+                "async": False,
+            }
+        )
 
     print("\n" + "="*60)
     print("jsonriver Python Benchmark")
@@ -134,4 +235,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop when available; pass --no-uvloop to compare against the
+    # default asyncio event loop. Worker processes make the same choice.
+    run_event_loop(main())
@@ -15,6 +15,11 @@ import sys
 import time
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add parent directory to path to import jsonriver
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -31,21 +36,26 @@ def load_test_data():
     return medium_json
 
 
-async def chunked_stream(text: str, chunk_size: int, delay_ms: float = 0):
-    """Convert string to chunked async stream with optional delay"""
-    for i in range(0, len(text), chunk_size):
+def split_chunks(text: str, chunk_size: int) -> list[str]:
+    """Split text into chunks once, outside of any timed region"""
+    return [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+
+
+async def chunked_stream(chunks: list[str], delay_ms: float = 0):
+    """Convert precomputed chunks to an async stream with optional delay"""
+    for chunk in chunks:
         if delay_ms > 0:
             await asyncio.sleep(delay_ms / 1000)
-        yield text[i : i + chunk_size]
+        yield chunk
 
 
-async def jsonriver_streaming(json_string: str, chunk_size: int):
+async def jsonriver_streaming(chunks: list[str]):
     """Parse JSON using jsonriver with chunked input"""
     first_value_time = None
     start = time.perf_counter()
 
     final_value = None
-    async for val in parse(chunked_stream(json_string, chunk_size)):
+    async for val in parse(chunked_stream(chunks)):
         if first_value_time is None:
             first_value_time = time.perf_counter() - start
         final_value = val
@@ -54,20 +64,14 @@ async def jsonriver_streaming(json_string: str, chunk_size: int):
     return total_time, first_value_time, final_value
 
 
-async def json_loads_streaming(json_string: str, chunk_size: int):
+def json_loads_streaming(json_string: str, num_chunks: int, delay_ms: float = 0):
     """Simulate json.loads with chunked input (must wait for all)"""
+    # A buffered parser does nothing until the last chunk arrives, so parse
+    # the complete string directly instead of timing an async loop that only
+    # collects chunks. Simulated network delay is added analytically.
     start = time.perf_counter()
-
-    # Collect all chunks first (simulating waiting for complete data)
-    chunks = []
-    async for chunk in chunked_stream(json_string, chunk_size):
-        chunks.append(chunk)
-
-    # Now parse
-    complete_string = "".join(chunks)
-    result = json.loads(complete_string)
-
-    total_time = time.perf_counter() - start
+    result = json.loads(json_string)
+    total_time = time.perf_counter() - start + num_chunks * delay_ms / 1000
     first_value_time = total_time  # Can only get value after everything arrives
 
     return total_time, first_value_time, result
@@ -80,6 +84,8 @@ async def benchmark_streaming(json_str: str, chunk_size: int, num_times: int):
     jsonloads_total_times = []
     jsonloads_first_times = []
 
+    chunks = split_chunks(json_str, chunk_size)
+
     print(f"Running streaming benchmark with {chunk_size} byte chunks...", end="", flush=True)
 
     for i in range(num_times):
@@ -87,12 +93,12 @@ async def benchmark_streaming(json_str: str, chunk_size: int, num_times: int):
             print(".", end="", flush=True)
 
         # Benchmark jsonriver
-        total, first, _ = await jsonriver_streaming(json_str, chunk_size)
+        total, first, _ = await jsonriver_streaming(chunks)
         jsonriver_total_times.append(total * 1000)  # to ms
         jsonriver_first_times.append(first * 1000)
 
         # Benchmark json.loads
-        total, first, _ = await json_loads_streaming(json_str, chunk_size)
+        total, first, _ = json_loads_streaming(json_str, len(chunks))
         jsonloads_total_times.append(total * 1000)
         jsonloads_first_times.append(first * 1000)
 
@@ -100,7 +106,7 @@ async def benchmark_streaming(json_str: str, chunk_size: int, num_times: int):
 
     # Report results
     file_size_kb = len(json_str) / 1024
-    num_chunks = (len(json_str) + chunk_size - 1) // chunk_size
+    num_chunks = len(chunks)
 
     print(f"File size: {file_size_kb:.1f} KB, Chunk size: {chunk_size} bytes, Chunks: {num_chunks}")
     print(f"Averaged over {num_times} runs\n")
@@ -135,10 +141,11 @@ async def benchmark_progressive_updates(json_str: str, chunk_size: int):
     print("Progressive updates demonstration:")
     print(f"Parsing {len(json_str)/1024:.1f} KB in {chunk_size} byte chunks\n")
 
+    chunks = split_chunks(json_str, chunk_size)
     start = time.perf_counter()
     update_count = 0
 
-    async for val in parse(chunked_stream(json_str, chunk_size)):
+    async for val in parse(chunked_stream(chunks)):
         update_count += 1
 
     total_time = (time.perf_counter() - start) * 1000
@@ -157,6 +164,8 @@ async def main():
     print("jsonriver Python Streaming Benchmark")
     print("=" * 70 + "\n")
 
+    loop_type = type(asyncio.get_running_loop())
+    print(f"Event loop: {loop_type.__module__}.{loop_type.__qualname__}")
     print("Loading test data...")
     json_str = load_test_data()
     print(f"Loaded {len(json_str)/1024:.1f} KB of JSON data\n")
@@ -177,4 +186,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop when available; pass --no-uvloop to compare against the
+    # default asyncio event loop.
+    if uvloop is not None and "--no-uvloop" not in sys.argv:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
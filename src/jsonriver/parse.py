@@ -23,7 +23,7 @@ JsonValue = Union[None, bool, float, str, list['JsonValue'], dict[str, 'JsonValu
 JsonObject = dict[str, JsonValue]
 
 
-async def parse(stream: AsyncIterator[str]) -> AsyncIterator[JsonValue]:
+def parse(stream: AsyncIterator[str]) -> AsyncIterator[JsonValue]:
     """
     Incrementally parse a single JSON value from the given iterable of string chunks.
 
@@ -59,9 +59,9 @@ async def parse(stream: AsyncIterator[str]) -> AsyncIterator[JsonValue]:
     6. As a consequence of 1 and 5, we only add a property to an object once we
        have the entire key and enough of the value to know that value's type.
     """
-    parser = _Parser(stream)
-    async for value in parser:
-        yield value
+    # The parser is itself an async iterator; returning it directly avoids
+    # an extra async generator resume for every yielded value.
+    return _Parser(stream)
 
 
 class _StateEnum(IntEnum):
@@ -75,12 +75,18 @@ class _StateEnum(IntEnum):
 
 class _State:
     """Base class for parser states"""
+    # A state is allocated for every string, array and object in the input,
+    # so avoid giving each one an instance __dict__.
+    __slots__ = ('type', 'value')
+
     type: _StateEnum
     value: JsonValue | tuple[str, JsonObject] | None
 
 
 class _InitialState(_State):
     """Initial state before any parsing"""
+    __slots__ = ()
+
     def __init__(self) -> None:
         self.type = _StateEnum.Initial
         self.value = None
@@ -88,6 +94,8 @@ class _InitialState(_State):
 
 class _InStringState(_State):
     """State while parsing a string"""
+    __slots__ = ()
+
     def __init__(self) -> None:
         self.type = _StateEnum.InString
         self.value = ''
@@ -95,6 +103,8 @@ class _InStringState(_State):
 
 class _InArrayState(_State):
     """State while parsing an array"""
+    __slots__ = ()
+
     def __init__(self) -> None:
         self.type = _StateEnum.InArray
         self.value: list[JsonValue] = []
@@ -102,6 +112,8 @@ class _InArrayState(_State):
 
 class _InObjectExpectingKeyState(_State):
     """State while parsing an object, expecting a key"""
+    __slots__ = ()
+
     def __init__(self) -> None:
         self.type = _StateEnum.InObjectExpectingKey
         self.value: JsonObject = {}
@@ -109,6 +121,8 @@ class _InObjectExpectingKeyState(_State):
 
 class _InObjectExpectingValueState(_State):
     """State while parsing an object, expecting a value"""
+    __slots__ = ()
+
     def __init__(self, key: str, obj: JsonObject) -> None:
         self.type = _StateEnum.InObjectExpectingValue
         self.value = (key, obj)
@@ -176,29 +190,30 @@ class _Parser:
     def handle_string_start(self) -> None:
         """Handle string start token"""
         state = self._current_state()
-        if not self._progressed and state.type != _StateEnum.InObjectExpectingKey:
+        state_type = state.type
+        if not self._progressed and state_type != _StateEnum.InObjectExpectingKey:
             self._progressed = True
 
-        if state.type == _StateEnum.Initial:
+        if state_type == _StateEnum.Initial:
             self._state_stack.pop()
             self._toplevel_value = self._progress_value(
                 JsonTokenType.StringStart, None
             )
 
-        elif state.type == _StateEnum.InArray:
+        elif state_type == _StateEnum.InArray:
             v = self._progress_value(JsonTokenType.StringStart, None)
             arr = cast(list[JsonValue], state.value)
             arr.append(v)
 
-        elif state.type == _StateEnum.InObjectExpectingKey:
+        elif state_type == _StateEnum.InObjectExpectingKey:
             self._state_stack.append(_InStringState())
 
-        elif state.type == _StateEnum.InObjectExpectingValue:
+        elif state_type == _StateEnum.InObjectExpectingValue:
             key, obj = cast(tuple[str, JsonObject], state.value)
             sv = self._progress_value(JsonTokenType.StringStart, None)
             obj[key] = sv
 
-        elif state.type == _StateEnum.InString:
+        elif state_type == _StateEnum.InString:
             raise ValueError(
                 f'Unexpected {json_token_type_to_string(JsonTokenType.StringStart)} '
                 f'token in the middle of string'
@@ -282,20 +297,21 @@ class _Parser:
     def _handle_value_token(self, token_type: JsonTokenType, value: JsonValue) -> None:
         """Handle a complete value token"""
         state = self._current_state()
+        state_type = state.type
 
         if not self._progressed:
             self._progressed = True
 
-        if state.type == _StateEnum.Initial:
+        if state_type == _StateEnum.Initial:
             self._state_stack.pop()
             self._toplevel_value = self._progress_value(token_type, value)
 
-        elif state.type == _StateEnum.InArray:
+        elif state_type == _StateEnum.InArray:
             v = self._progress_value(token_type, value)
             arr = cast(list[JsonValue], state.value)
             arr.append(v)
 
-        elif state.type == _StateEnum.InObjectExpectingValue:
+        elif state_type == _StateEnum.InObjectExpectingValue:
             key, obj = cast(tuple[str, JsonObject], state.value)
             if token_type != JsonTokenType.StringStart:
                 self._state_stack.pop()
@@ -306,13 +322,13 @@ class _Parser:
             v = self._progress_value(token_type, value)
             obj[key] = v
 
-        elif state.type == _StateEnum.InString:
+        elif state_type == _StateEnum.InString:
             raise ValueError(
                 f'Unexpected {json_token_type_to_string(token_type)} '
                 f'token in the middle of string'
             )
 
-        elif state.type == _StateEnum.InObjectExpectingKey:
+        elif state_type == _StateEnum.InObjectExpectingKey:
             raise ValueError(
                 f'Unexpected {json_token_type_to_string(token_type)} '
                 f'token in the middle of object expecting key'
@@ -322,12 +338,14 @@ class _Parser:
         """Update parent container with updated string value"""
         if parent_state is None:
             self._toplevel_value = updated
+            return
 
-        elif parent_state.type == _StateEnum.InArray:
+        parent_type = parent_state.type
+        if parent_type == _StateEnum.InArray:
             arr = cast(list[JsonValue], parent_state.value)
             arr[-1] = updated
 
-        elif parent_state.type == _StateEnum.InObjectExpectingValue:
+        elif parent_type == _StateEnum.InObjectExpectingValue:
             key, obj = cast(tuple[str, JsonObject], parent_state.value)
             obj[key] = updated
             if self._state_stack and self._state_stack[-1] == parent_state:
@@ -336,7 +354,7 @@ class _Parser:
                 new_state.value = obj
                 self._state_stack.append(new_state)
 
-        elif parent_state.type == _StateEnum.InObjectExpectingKey:
+        elif parent_type == _StateEnum.InObjectExpectingKey:
             if self._state_stack and self._state_stack[-1] == parent_state:
                 self._state_stack.pop()
                 obj = cast(JsonObject, parent_state.value)
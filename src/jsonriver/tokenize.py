@@ -8,7 +8,7 @@ SPDX-License-Identifier: BSD-3-Clause
 
 from __future__ import annotations
 from enum import IntEnum
-from typing import Protocol, AsyncIterator
+from typing import Callable, Protocol, AsyncIterator
 import re
 
 
@@ -41,21 +41,23 @@ class JsonTokenType(IntEnum):
     ObjectEnd = 9
 
 
+_JSON_TOKEN_TYPE_NAMES = {
+    JsonTokenType.Null: 'null',
+    JsonTokenType.Boolean: 'boolean',
+    JsonTokenType.Number: 'number',
+    JsonTokenType.StringStart: 'string start',
+    JsonTokenType.StringMiddle: 'string middle',
+    JsonTokenType.StringEnd: 'string end',
+    JsonTokenType.ArrayStart: 'array start',
+    JsonTokenType.ArrayEnd: 'array end',
+    JsonTokenType.ObjectStart: 'object start',
+    JsonTokenType.ObjectEnd: 'object end',
+}
+
+
 def json_token_type_to_string(token_type: JsonTokenType) -> str:
     """Convert token type to readable string"""
-    names = {
-        JsonTokenType.Null: 'null',
-        JsonTokenType.Boolean: 'boolean',
-        JsonTokenType.Number: 'number',
-        JsonTokenType.StringStart: 'string start',
-        JsonTokenType.StringMiddle: 'string middle',
-        JsonTokenType.StringEnd: 'string end',
-        JsonTokenType.ArrayStart: 'array start',
-        JsonTokenType.ArrayEnd: 'array end',
-        JsonTokenType.ObjectStart: 'object start',
-        JsonTokenType.ObjectEnd: 'object end',
-    }
-    return names[token_type]
+    return _JSON_TOKEN_TYPE_NAMES[token_type]
 
 
 class _State(IntEnum):
@@ -73,6 +75,31 @@ class _State(IntEnum):
 # Regex for validating JSON numbers
 _JSON_NUMBER_PATTERN = re.compile(r'^-?(0|[1-9]\d*)(\.\d+)?([eE][+-]?\d+)?$')
 
+# First character that cannot be part of a number (anything but 0-9 - + . e E)
+_NUMBER_END_PATTERN = re.compile(r'[^0-9\-+.eE]')
+
+# First character that isn't JSON whitespace (space, tab, \n, \r)
+_NON_WHITESPACE_PATTERN = re.compile(r'[^ \t\n\r]')
+
+# Characters that end a run of plain string content: quote, backslash, or a
+# control character (which is invalid unescaped)
+_STRING_SPECIAL_PATTERN = re.compile(r'["\\\x00-\x1f]')
+
+# The four hex digits of a \uXXXX escape
+_HEX4_PATTERN = re.compile(r'[0-9a-fA-F]{4}')
+
+# Decoded value of each single-character escape (everything but \u)
+_SIMPLE_ESCAPES = {
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+    'b': '\b',
+    'f': '\f',
+    '\\': '\\',
+    '/': '/',
+    '"': '"',
+}
+
 
 def _parse_json_number(s: str) -> float:
     """Parse a JSON number string, validating format"""
@@ -112,6 +139,12 @@ class _Input:
             return self._buffer[idx]
         return None
 
+    def count_number_chars(self) -> int:
+        """Count characters from the current position that may form a number"""
+        match = _NUMBER_END_PATTERN.search(self._buffer, self._start_index)
+        end = match.start() if match else len(self._buffer)
+        return end - self._start_index
+
     def peek_char_code(self, offset: int) -> int:
         """Get character code at offset"""
         return ord(self._buffer[self._start_index + offset])
@@ -151,7 +184,13 @@ class _Input:
         """Try to read more content into buffer. Returns False if stream exhausted."""
         try:
             chunk = await self._stream.__anext__()
-            self._buffer += chunk
+            # Drop consumed input while appending, so the new buffer is built
+            # in a single copy that doesn't carry already-tokenized content.
+            if self._start_index > 0:
+                self._buffer = self._buffer[self._start_index:] + chunk
+                self._start_index = 0
+            else:
+                self._buffer += chunk
             return True
         except StopAsyncIteration:
             self.buffer_complete = True
@@ -161,14 +200,13 @@ class _Input:
 
     def skip_past_whitespace(self) -> None:
         """Skip whitespace characters"""
+        buf = self._buffer
         i = self._start_index
-        while i < len(self._buffer):
-            c = ord(self._buffer[i])
-            if c in (32, 9, 10, 13):  # space, tab, \n, \r
-                i += 1
-            else:
-                break
-        self._start_index = i
+        # Most values aren't preceded by whitespace, so check one character
+        # before handing runs of indentation to the compiled pattern.
+        if i < len(buf) and buf[i] in ' \t\n\r':
+            match = _NON_WHITESPACE_PATTERN.search(buf, i)
+            self._start_index = match.start() if match else len(buf)
 
     def try_to_take_prefix(self, prefix: str) -> bool:
         """Try to consume prefix from buffer, return True if successful"""
@@ -200,16 +238,14 @@ class _Input:
         Returns tuple of (consumed_content, pattern_found)
         """
         buf = self._buffer
-        i = self._start_index
-        while i < len(buf):
-            c = ord(buf[i])
-            if c <= 0x1F:
+        match = _STRING_SPECIAL_PATTERN.search(buf, self._start_index)
+        if match is not None:
+            i = match.start()
+            if ord(buf[i]) <= 0x1F:
                 raise ValueError('Unescaped control character in string')
-            if c == 34 or c == 92:  # " or \
-                result = buf[self._start_index:i]
-                self._start_index = i
-                return (result, True)
-            i += 1
+            result = buf[self._start_index:i]
+            self._start_index = i
+            return (result, True)
 
         result = buf[self._start_index:]
         self._start_index = len(buf)
@@ -239,6 +275,17 @@ class Tokenizer:
         self._handler = handler
         self._stack: list[_State] = [_State.ExpectingValue]
         self._emitted_tokens = 0
+        # Step function for each state, indexed by _State value
+        self._state_handlers: tuple[Callable[[], None], ...] = (
+            self._tokenize_value,  # ExpectingValue
+            self._tokenize_string,  # InString
+            self._tokenize_array_start,  # StartArray
+            self._tokenize_after_array_value,  # AfterArrayValue
+            self._tokenize_object_start,  # StartObject
+            self._tokenize_after_object_key,  # AfterObjectKey
+            self._tokenize_after_object_value,  # AfterObjectValue
+            self._tokenize_before_object_key,  # BeforeObjectKey
+        )
 
     def is_done(self) -> bool:
         """Check if tokenization is complete"""
@@ -276,82 +323,58 @@ class Tokenizer:
         if not self._stack:
             return
 
-        state = self._stack[-1]
-
-        if state == _State.ExpectingValue:
-            self._tokenize_value()
-        elif state == _State.InString:
-            self._tokenize_string()
-        elif state == _State.StartArray:
-            self._tokenize_array_start()
-        elif state == _State.AfterArrayValue:
-            self._tokenize_after_array_value()
-        elif state == _State.StartObject:
-            self._tokenize_object_start()
-        elif state == _State.AfterObjectKey:
-            self._tokenize_after_object_key()
-        elif state == _State.AfterObjectValue:
-            self._tokenize_after_object_value()
-        elif state == _State.BeforeObjectKey:
-            self._tokenize_before_object_key()
+        self._state_handlers[self._stack[-1]]()
 
     def _tokenize_value(self) -> None:
         """Tokenize a JSON value"""
-        self.input.skip_past_whitespace()
-
-        if self.input.try_to_take_prefix('null'):
-            self._handler.handle_null()
-            self._emitted_tokens += 1
-            self._stack.pop()
+        inp = self.input
+        inp.skip_past_whitespace()
+        if inp.length == 0:
             return
 
-        if self.input.try_to_take_prefix('true'):
-            self._handler.handle_boolean(True)
-            self._emitted_tokens += 1
-            self._stack.pop()
-            return
+        # Branch on the first character so each value is matched against
+        # only the token it can start, rather than trying every literal.
+        ch = inp.peek_char_code(0)
 
-        if self.input.try_to_take_prefix('false'):
-            self._handler.handle_boolean(False)
-            self._emitted_tokens += 1
+        if ch == 0x22:  # "
+            inp.advance(1)
             self._stack.pop()
+            self._stack.append(_State.InString)
+            self._handler.handle_string_start()
+            self._emitted_tokens += 1
+            self._tokenize_string()
             return
 
-        if self.input.length > 0:
-            ch = self.input.peek_char_code(0)
-            if (48 <= ch <= 57) or ch == 45:  # 0-9 or -
-                # Scan for end of number
-                i = 0
-                while i < self.input.length:
-                    c = self.input.peek_char_code(i)
-                    if (48 <= c <= 57) or c in (45, 43, 46, 101, 69):  # 0-9 - + . e E
-                        i += 1
-                    else:
-                        break
-
-                if i == self.input.length and not self.input.buffer_complete:
-                    # Need more input (numbers have no terminator)
-                    self.input.more_content_expected = False
-                    return
+        if (48 <= ch <= 57) or ch == 45:  # 0-9 or -
+            # Scan for end of number. This is redone from the start of the
+            # number whenever a chunk boundary splits it, so keep it in C.
+            i = inp.count_number_chars()
 
-                number_chars = self.input.slice(0, i)
-                self.input.advance(i)
-                number = _parse_json_number(number_chars)
-                self._handler.handle_number(number)
-                self._emitted_tokens += 1
-                self._stack.pop()
-                self.input.more_content_expected = True
+            if i == inp.length and not inp.buffer_complete:
+                # Need more input (numbers have no terminator)
+                inp.more_content_expected = False
                 return
 
-        if self.input.try_to_take_prefix('"'):
+            number_chars = inp.slice(0, i)
+            inp.advance(i)
+            number = _parse_json_number(number_chars)
+            self._handler.handle_number(number)
+            self._emitted_tokens += 1
             self._stack.pop()
-            self._stack.append(_State.InString)
-            self._handler.handle_string_start()
+            inp.more_content_expected = True
+            return
+
+        if ch == 0x7B:  # {
+            inp.advance(1)
+            self._stack.pop()
+            self._stack.append(_State.StartObject)
+            self._handler.handle_object_start()
             self._emitted_tokens += 1
-            self._tokenize_string()
+            self._tokenize_object_start()
             return
 
-        if self.input.try_to_take_prefix('['):
+        if ch == 0x5B:  # [
+            inp.advance(1)
             self._stack.pop()
             self._stack.append(_State.StartArray)
             self._handler.handle_array_start()
@@ -359,18 +382,32 @@ class Tokenizer:
             self._tokenize_array_start()
             return
 
-        if self.input.try_to_take_prefix('{'):
-            self._stack.pop()
-            self._stack.append(_State.StartObject)
-            self._handler.handle_object_start()
-            self._emitted_tokens += 1
-            self._tokenize_object_start()
+        if ch == 0x6E:  # n
+            if inp.try_to_take_prefix('null'):
+                self._handler.handle_null()
+                self._emitted_tokens += 1
+                self._stack.pop()
+            return
+
+        if ch == 0x74:  # t
+            if inp.try_to_take_prefix('true'):
+                self._handler.handle_boolean(True)
+                self._emitted_tokens += 1
+                self._stack.pop()
+            return
+
+        if ch == 0x66:  # f
+            if inp.try_to_take_prefix('false'):
+                self._handler.handle_boolean(False)
+                self._emitted_tokens += 1
+                self._stack.pop()
             return
 
     def _tokenize_string(self) -> None:
         """Tokenize string content"""
+        inp = self.input
         while True:
-            chunk, interrupted = self.input.take_until_quote_or_backslash()
+            chunk, interrupted = inp.take_until_quote_or_backslash()
             if chunk:
                 self._handler.handle_string_middle(chunk)
                 self._emitted_tokens += 1
@@ -378,66 +415,42 @@ class Tokenizer:
                 return
 
             if interrupted:
-                if self.input.length == 0:
+                if inp.length == 0:
                     return
 
-                next_char = self.input.peek(0)
+                next_char = inp.peek(0)
                 if next_char == '"':
-                    self.input.advance(1)
+                    inp.advance(1)
                     self._handler.handle_string_end()
                     self._emitted_tokens += 1
                     self._stack.pop()
                     return
 
                 # Handle escape sequences
-                next_char2 = self.input.peek(1)
+                next_char2 = inp.peek(1)
                 if next_char2 is None:
                     return
 
-                value: str
                 if next_char2 == 'u':
                     # Unicode escape: need 4 hex digits
-                    if self.input.length < 6:
+                    if inp.length < 6:
                         return
 
-                    code = 0
-                    for j in range(2, 6):
-                        c = self.input.peek_char_code(j)
-                        if 48 <= c <= 57:  # 0-9
-                            digit = c - 48
-                        elif 65 <= c <= 70:  # A-F
-                            digit = c - 55
-                        elif 97 <= c <= 102:  # a-f
-                            digit = c - 87
-                        else:
-                            raise ValueError('Bad Unicode escape in JSON')
-                        code = (code << 4) | digit
-
-                    self.input.advance(6)
-                    self._handler.handle_string_middle(chr(code))
+                    hex_digits = inp.slice(2, 6)
+                    # int() alone would also accept signs, spaces and '_'
+                    if not _HEX4_PATTERN.fullmatch(hex_digits):
+                        raise ValueError('Bad Unicode escape in JSON')
+
+                    inp.advance(6)
+                    self._handler.handle_string_middle(chr(int(hex_digits, 16)))
                     self._emitted_tokens += 1
                     continue
 
-                elif next_char2 == 'n':
-                    value = '\n'
-                elif next_char2 == 'r':
-                    value = '\r'
-                elif next_char2 == 't':
-                    value = '\t'
-                elif next_char2 == 'b':
-                    value = '\b'
-                elif next_char2 == 'f':
-                    value = '\f'
-                elif next_char2 == '\\':
-                    value = '\\'
-                elif next_char2 == '/':
-                    value = '/'
-                elif next_char2 == '"':
-                    value = '"'
-                else:
+                value = _SIMPLE_ESCAPES.get(next_char2)
+                if value is None:
                     raise ValueError('Bad escape in string')
 
-                self.input.advance(2)
+                inp.advance(2)
                 self._handler.handle_string_middle(value)
                 self._emitted_tokens += 1
 
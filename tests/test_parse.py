@@ -286,3 +286,20 @@ class TestParse:
             results = await to_array(parse(stream))
             assert len(results) > 0
             assert results[-1] == expected, f"Failed to parse {json_str}"
+
+    @pytest.mark.asyncio
+    async def test_stream_not_read_until_iterated(self):
+        """Test that calling parse doesn't consume the stream by itself"""
+        pulled: list[str] = []
+
+        async def stream():
+            for chunk in ['[1,', ' 2]']:
+                pulled.append(chunk)
+                yield chunk
+
+        values = parse(stream())
+        assert pulled == []
+
+        results = await to_array(values)
+        assert pulled == ['[1,', ' 2]']
+        assert results[-1] == [1, 2]
@@ -265,3 +265,28 @@ class TestTokenize:
         ]
 
         assert tokens == expected
+
+    @pytest.mark.asyncio
+    async def test_tokenize_unescaped_control_character(self):
+        """Test that control characters inside strings are rejected"""
+        for chunks in [('"a\nb"',), ('"ab', 'c\td"'), ('"\x1f"',)]:
+            with pytest.raises(ValueError, match='Unescaped control character'):
+                await tokenize_to_list(*chunks)
+
+    @pytest.mark.asyncio
+    async def test_tokenize_unicode_escape(self):
+        """Test \\u escapes, including ones split across chunks"""
+        for chunks in [('"\\u00e9"',), ('"\\u0', '0E9"'), ('"\\', 'u00e9"')]:
+            tokens = await tokenize_to_list(*chunks)
+            assert tokens == [
+                {"type": JsonTokenType.StringStart, "value": None},
+                {"type": JsonTokenType.StringMiddle, "value": "é"},
+                {"type": JsonTokenType.StringEnd, "value": None},
+            ]
+
+    @pytest.mark.asyncio
+    async def test_tokenize_bad_unicode_escape(self):
+        """Test that malformed \\u escapes are rejected"""
+        for bad in ['"\\u00g9"', '"\\u+0e9"', '"\\u 0e9"', '"\\u0_e9"']:
+            with pytest.raises(ValueError, match='Bad Unicode escape'):
+                await tokenize_to_list(bad)